@@ -4,8 +4,10 @@ Analyzer Worker Package
 Security analysis, performance optimization, and code quality assessment specialist.
 """
 
-from .agent import analyzer_agent
+from shared.tools import lazy_agent_getattr
 
 __all__ = [
     'analyzer_agent',
-]
\ No newline at end of file
+]
+
+__getattr__ = lazy_agent_getattr(__name__, __all__)
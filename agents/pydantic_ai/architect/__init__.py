@@ -4,8 +4,10 @@ Architect Worker Package
 System design, scalability patterns, and technical architecture specialist.
 """
 
-from .agent import architect_agent
+from shared.tools import lazy_agent_getattr
 
 __all__ = [
     'architect_agent',
-]
\ No newline at end of file
+]
+
+__getattr__ = lazy_agent_getattr(__name__, __all__)
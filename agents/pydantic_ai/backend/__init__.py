@@ -4,6 +4,8 @@ Backend Worker Package
 API development, database design, and service implementation specialist.
 """
 
-from .agent import backend_agent
+from shared.tools import lazy_agent_getattr
 
 __all__ = ["backend_agent"]
+
+__getattr__ = lazy_agent_getattr(__name__, __all__)
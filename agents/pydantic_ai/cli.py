@@ -10,11 +10,6 @@ with standardized argument handling and execution routing.
 
 import argparse
 import sys
-import subprocess
-import os
-
-# Get the directory of this script
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
 def run_queen(args):
@@ -103,11 +98,13 @@ def run_scribe(args):
 
 
 def run_worker(worker_name: str, args):
-    """Run a specific worker agent"""
-    worker_runner = os.path.join(SCRIPT_DIR, worker_name, "runner.py")
-    cmd = [
-        sys.executable,
-        worker_runner,
+    """Run a specific worker agent in-process via its runner's CLI entry point"""
+    import importlib
+
+    # Same runner CLI as `python <worker>/runner.py ...`, without paying for a
+    # second interpreter start and re-importing pydantic_ai in a child process
+    runner = importlib.import_module(f"{worker_name}.runner")
+    argv = [
         "--session",
         args.session,
         "--model",
@@ -116,15 +113,15 @@ def run_worker(worker_name: str, args):
 
     # Add task only if provided
     if args.task is not None:
-        cmd.extend(["--task", args.task])
+        argv.extend(["--task", args.task])
 
     # Add phase flags if specified
     if hasattr(args, "setup") and args.setup:
-        cmd.append("--setup")
+        argv.append("--setup")
     if hasattr(args, "output") and args.output:
-        cmd.append("--output")
+        argv.append("--output")
 
-    return subprocess.run(cmd)
+    return runner.main(argv)
 
 
 def main():
@@ -207,6 +204,8 @@ Examples:
         ("test", "Testing strategy, quality assurance, and test coverage analysis"),
     ]
 
+    worker_names = frozenset(worker_name for worker_name, _ in workers)
+
     for worker_name, worker_description in workers:
         worker_parser = subparsers.add_parser(worker_name, help=worker_description)
         worker_parser.add_argument("--session", required=True, help="Session ID")
@@ -237,17 +236,8 @@ Examples:
         return run_queen(args)
     elif args.agent == "scribe":
         return run_scribe(args)
-    elif args.agent in [
-        "analyzer",
-        "architect",
-        "backend",
-        "designer",
-        "devops",
-        "frontend",
-        "researcher",
-        "test",
-    ]:
-        return run_worker(args.agent, args).returncode
+    elif args.agent in worker_names:
+        return run_worker(args.agent, args)
     else:
         print(f"Unknown agent: {args.agent}")
         return 1
@@ -4,8 +4,10 @@ Designer Worker Package
 User experience design, visual design, accessibility, and design systems specialist.
 """
 
-from .agent import designer_agent
+from shared.tools import lazy_agent_getattr
 
 __all__ = [
     'designer_agent',
-]
\ No newline at end of file
+]
+
+__getattr__ = lazy_agent_getattr(__name__, __all__)
@@ -4,8 +4,10 @@ DevOps Worker Package
 Infrastructure, deployment, monitoring, and CI/CD pipeline specialist.
 """
 
-from .agent import devops_agent
+from shared.tools import lazy_agent_getattr
 
 __all__ = [
     'devops_agent',
-]
\ No newline at end of file
+]
+
+__getattr__ = lazy_agent_getattr(__name__, __all__)
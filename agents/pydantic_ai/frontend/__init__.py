@@ -4,8 +4,10 @@ Frontend Worker Package
 UI/UX implementation, component architecture, and state management specialist.
 """
 
-from .agent import frontend_agent
+from shared.tools import lazy_agent_getattr
 
 __all__ = [
     'frontend_agent',
-]
\ No newline at end of file
+]
+
+__getattr__ = lazy_agent_getattr(__name__, __all__)
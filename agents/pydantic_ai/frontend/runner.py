@@ -9,7 +9,9 @@ from pathlib import Path
 from typing import Dict, Any
 
 # Minimal path setup to enable shared imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+pydantic_ai_root = str(Path(__file__).parent.parent)
+if pydantic_ai_root not in sys.path:
+    sys.path.insert(0, pydantic_ai_root)
 
 from shared.base_worker import BaseWorker
 from shared.models import WorkerOutput
@@ -80,7 +82,7 @@ class FrontendWorker(BaseWorker):
         """
         return {
             "duration": "calculated",
-            "metrics": output.metrics.model_dump(),
+            "metrics": dict(output.metrics),
             "status": output.status,
         }
 
@@ -96,10 +98,10 @@ class FrontendWorker(BaseWorker):
         return f"Frontend analysis completed successfully. Components analyzed: {output.metrics.items_analyzed}, Issues found: {output.metrics.issues_found}"
 
 
-def main():
+def main(argv=None):
     """CLI entry point for frontend worker"""
     worker = FrontendWorker()
-    return worker.run_cli_main()
+    return worker.run_cli_main(argv)
 
 
 if __name__ == "__main__":
@@ -5,11 +5,18 @@ Intelligent task orchestration with continuous monitoring.
 """
 
 from .agent import queen_agent
-from .models import QueenOrchestrationPlan, WorkerAssignment, CodebaseInsight, QueenOutput
+from .models import (
+    QueenOrchestrationPlan,
+    QueenOrchestrationPlanRecord,
+    WorkerAssignment,
+    CodebaseInsight,
+    QueenOutput,
+)
 
 __all__ = [
     'queen_agent',
     'QueenOrchestrationPlan', 
+    'QueenOrchestrationPlanRecord',
     'WorkerAssignment',
     'CodebaseInsight',
     'QueenOutput'
@@ -119,6 +119,15 @@ class QueenOrchestrationPlan(BaseModel):
     )
 
 
+class QueenOrchestrationPlanRecord(QueenOrchestrationPlan):
+    """Orchestration plan as persisted to workers/orchestration/orchestration_plan.json"""
+
+    execution_metadata: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Execution details recorded when the plan was persisted",
+    )
+
+
 class QueenOutput(WorkerOutput):
     """Queen orchestrator unified output extending WorkerOutput"""
 
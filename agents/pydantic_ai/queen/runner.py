@@ -7,18 +7,7 @@ BaseWorker implementation for strategic multi-worker orchestration.
 
 import sys
 from pathlib import Path
-import json
-
 from typing import Dict, Any
-from pydantic_ai import Agent
-from pydantic_ai.models import ModelSettings
-from .models import QueenOrchestrationPlan
-from shared.base_worker import BaseWorker
-from queen.models import QueenOutput
-from queen.agent import queen_agent, QueenAgentConfig
-from shared.protocols import SessionManagement
-from shared.protocols import create_worker_prompts_from_plan
-from shared.tools import iso_now
 
 # Ensure imports work when run directly or from CLI
 current_dir = Path(__file__).parent
@@ -26,6 +15,18 @@ pydantic_ai_root = current_dir.parent
 if str(pydantic_ai_root) not in sys.path:
     sys.path.insert(0, str(pydantic_ai_root))
 
+from pydantic_ai import Agent
+from pydantic_ai.models import ModelSettings
+from shared.base_worker import BaseWorker
+from queen.models import (
+    QueenOrchestrationPlan,
+    QueenOrchestrationPlanRecord,
+    QueenOutput,
+)
+from queen.agent import queen_agent, QueenAgentConfig
+from shared.protocols import SessionManagement, create_worker_prompts_from_plan
+from shared.tools import iso_now
+
 
 class QueenWorker(BaseWorker):
     """
@@ -50,31 +51,34 @@ class QueenWorker(BaseWorker):
         # Update session config before any logging
         self.update_session_config(session_id)
 
-        # Log queen spawned event
-        self.log_event(
-            "queen_spawned",
-            {
-                "worker_type": "queen-orchestrator",
-                "mode": "orchestration",
-                "purpose": "Task AI Analysis",
-            },
-            "INFO",
-        )
+        # Spawn, validation and analysis_started logs flush together, before
+        # the model call
+        with self.batch_logs():
+            # Log queen spawned event
+            self.log_event(
+                "queen_spawned",
+                {
+                    "worker_type": "queen-orchestrator",
+                    "mode": "orchestration",
+                    "purpose": "Task AI Analysis",
+                },
+                "INFO",
+            )
 
-        self.validate_session(session_id)
+            self.validate_session(session_id)
+
+            # Log analysis started event after queen spawned
+            self.log_event(
+                "analysis_started",
+                self.get_analysis_event_details(task_description),
+                "INFO",
+            )
         return self.execute_queen_analysis(session_id, task_description, model)
 
     def execute_queen_analysis(
         self, session_id: str, task_description: str, model: str
     ) -> Any:
         """Execute orchestration analysis using Pydantic AI agent"""
-        # Log analysis started event after queen spawned
-        self.log_event(
-            "analysis_started",
-            self.get_analysis_event_details(task_description),
-            "INFO",
-        )
-
         queen_prompt = f"Using the Queen Agent, analyze task and create orchestration plan.\nTask: {task_description}\nSession: {session_id}"
 
         # Handle custom models with settings-based output style
@@ -99,12 +103,16 @@ class QueenWorker(BaseWorker):
             )
 
         orchestration_plan = orchestration_result.output
-        session_path = SessionManagement.get_session_path(session_id)
+        worker_assignments = orchestration_plan.worker_assignments
+        worker_count = len(worker_assignments)
+        session_path = Path(SessionManagement.get_session_path(session_id))
 
         project_root = Path(SessionManagement.detect_project_root())
-        relative_session_path = str(Path(session_path).relative_to(project_root))
+        relative_session_path = str(session_path.relative_to(project_root))
 
-        # Generate worker-specific prompts from orchestration plan
+        # Generate worker-specific prompts from orchestration plan. This runs
+        # before the batch below: its WorkerManager logs worker_prompts_created
+        # directly, which must not land ahead of the queen's buffered entries
         try:
             create_worker_prompts_from_plan(session_id, orchestration_plan)
         except Exception as e:
@@ -113,7 +121,7 @@ class QueenWorker(BaseWorker):
                 {
                     "exception_type": str(type(e)),
                     "error": str(e),
-                    "worker_count": len(orchestration_plan.worker_assignments),
+                    "worker_count": worker_count,
                 },
                 "WARNING",
             )
@@ -125,19 +133,17 @@ class QueenWorker(BaseWorker):
             status="completed",
             summary={
                 "key_findings": [
-                    f"Orchestration plan generated with {len(orchestration_plan.worker_assignments)} workers",
-                    f"Worker-specific prompts created for {len(orchestration_plan.worker_assignments)} specialists",
+                    f"Orchestration plan generated with {worker_count} workers",
+                    f"Worker-specific prompts created for {worker_count} specialists",
                     f"Coordination strategy: {orchestration_plan.execution_strategy}",
                 ],
                 "critical_issues": [],
                 "recommendations": [
-                    assignment.rationale
-                    for assignment in orchestration_plan.worker_assignments
+                    assignment.rationale for assignment in worker_assignments
                 ],
             },
             workers_spawned=[
-                assignment.worker_type
-                for assignment in orchestration_plan.worker_assignments
+                assignment.worker_type for assignment in worker_assignments
             ],
             coordination_status="planned",
             monitoring_active=False,
@@ -147,11 +153,12 @@ class QueenWorker(BaseWorker):
         # Store orchestration_plan temporarily for file creation
         queen_output._orchestration_plan = orchestration_plan
 
-        session_path = Path(SessionManagement.get_session_path(session_id))
-        self.create_worker_specific_files(session_id, queen_output, session_path)
+        # File creation debug logs and analysis_completed share one flush
+        with self.batch_logs():
+            self.create_worker_specific_files(session_id, queen_output, session_path)
 
-        completion_details = self.get_completion_event_details(queen_output)
-        self.log_event("analysis_completed", completion_details)
+            completion_details = self.get_completion_event_details(queen_output)
+            self.log_event("analysis_completed", completion_details)
 
         return queen_output
 
@@ -193,20 +200,25 @@ class QueenWorker(BaseWorker):
         orchestration_dir = session_path / "workers" / "orchestration"
         orchestration_dir.mkdir(parents=True, exist_ok=True)
 
-        # Create enhanced orchestration plan with execution metadata
-        orchestration_data = output._orchestration_plan.model_dump()
-
-        # Add execution metadata that was previously in worker_spawns.json
-        orchestration_data["execution_metadata"] = {
-            "workers_spawned": output.workers_spawned,
-            "coordination_status": output.coordination_status,
-            "monitoring_active": output.monitoring_active,
-            "session_path": output.session_path,
-            "execution_timestamp": output.timestamp,
-        }
+        # Create enhanced orchestration plan with execution metadata. The plan
+        # is already validated, so construct the record from its fields and let
+        # pydantic-core serialize it directly rather than via a model_dump() dict
+        orchestration_record = QueenOrchestrationPlanRecord.model_construct(
+            **dict(output._orchestration_plan),
+            # Add execution metadata that was previously in worker_spawns.json
+            execution_metadata={
+                "workers_spawned": output.workers_spawned,
+                "coordination_status": output.coordination_status,
+                "monitoring_active": output.monitoring_active,
+                "session_path": output.session_path,
+                "execution_timestamp": output.timestamp,
+            },
+        )
 
         orchestration_file = orchestration_dir / "orchestration_plan.json"
-        orchestration_file.write_text(json.dumps(orchestration_data, indent=2))
+        orchestration_file.write_text(
+            orchestration_record.model_dump_json(indent=2), encoding="utf-8"
+        )
 
         # Update SESSION.md with orchestration summary
         self._update_session_md(session_path, output._orchestration_plan, output)
@@ -238,12 +250,14 @@ class QueenWorker(BaseWorker):
             if progress_idx == -1:
                 return  # No Progress section found
 
+            worker_count = len(orchestration_plan.worker_assignments)
+
             # Update progress section
             progress_section = [
                 "## Progress",
                 "- [x] Session initialization",
                 "- [x] Queen orchestration completed",
-                f"- [x] {len(orchestration_plan.worker_assignments)} workers planned",
+                f"- [x] {worker_count} workers planned",
                 f"- [x] Execution strategy: {orchestration_plan.execution_strategy}",
                 "- [ ] Worker deployment",
                 "- [ ] Synthesis",
@@ -256,7 +270,7 @@ class QueenWorker(BaseWorker):
                 f"**Coordination Complexity:** {orchestration_plan.coordination_complexity}/5",
                 f"**Execution Strategy:** {orchestration_plan.execution_strategy}",
                 f"**Estimated Duration:** {orchestration_plan.estimated_total_duration}",
-                f"**Workers Deployed:** {len(orchestration_plan.worker_assignments)}",
+                f"**Workers Deployed:** {worker_count}",
                 "",
                 "### Strategic Assessment",
                 orchestration_plan.orchestration_rationale,
@@ -265,10 +279,10 @@ class QueenWorker(BaseWorker):
             ]
 
             # Add worker assignments with priorities
-            for assignment in orchestration_plan.worker_assignments:
-                orchestration_section.append(
-                    f"- **{assignment.worker_type}** ({assignment.priority}) - {assignment.task_focus}"
-                )
+            orchestration_section.extend(
+                f"- **{assignment.worker_type}** ({assignment.priority}) - {assignment.task_focus}"
+                for assignment in orchestration_plan.worker_assignments
+            )
 
             # Add coordination notes
             if orchestration_plan.coordination_notes:
@@ -278,8 +292,9 @@ class QueenWorker(BaseWorker):
                         "### Coordination Strategy",
                     ]
                 )
-                for note in orchestration_plan.coordination_notes:
-                    orchestration_section.append(f"- {note}")
+                orchestration_section.extend(
+                    f"- {note}" for note in orchestration_plan.coordination_notes
+                )
 
             # Reconstruct content
             if notes_idx != -1:
@@ -297,8 +312,10 @@ class QueenWorker(BaseWorker):
                     lines[:progress_idx] + progress_section + orchestration_section
                 )
 
-            # Write updated content
-            session_md_path.write_text("\n".join(new_lines))
+            # Write updated content - atomic so readers never see a partial file
+            SessionManagement.write_text_atomically(
+                str(session_md_path), "\n".join(new_lines)
+            )
 
         except Exception as e:
             # Log error but don't fail the operation
@@ -4,8 +4,10 @@ Researcher Worker Package
 Technical research, best practices, and industry standards analysis specialist.
 """
 
-from .agent import researcher_agent
+from shared.tools import lazy_agent_getattr
 
 __all__ = [
     'researcher_agent',
-]
\ No newline at end of file
+]
+
+__getattr__ = lazy_agent_getattr(__name__, __all__)
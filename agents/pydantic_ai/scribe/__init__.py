@@ -4,11 +4,22 @@ Scribe Agent Package
 Session creation and synthesis management.
 """
 
+from shared.tools import lazy_agent_getattr
 from .models import TaskSummaryOutput, ScribeSessionCreationOutput, ScribeSynthesisOutput, ScribeOutput
 
+# Agent instances live in .agent and are resolved on first access
+_AGENT_EXPORTS = (
+    'task_summary_agent',
+    'session_creation_agent',
+    'synthesis_agent',
+)
+
 __all__ = [
     'TaskSummaryOutput',
     'ScribeSessionCreationOutput', 
     'ScribeSynthesisOutput',
-    'ScribeOutput'
-]
\ No newline at end of file
+    'ScribeOutput',
+    *_AGENT_EXPORTS,
+]
+
+__getattr__ = lazy_agent_getattr(__name__, _AGENT_EXPORTS)
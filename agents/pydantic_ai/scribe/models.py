@@ -4,9 +4,26 @@ Scribe Agent Models
 Pydantic models specific to Scribe agent functionality.
 """
 
-from typing import List, Dict, Any, Optional, Literal
+from typing import List, Dict, Any, Optional, Literal, Type, TypeVar
 from pydantic import BaseModel, Field
 
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+
+class _TrustedConstructible(BaseModel):
+    """Base for scribe outputs that the runner assembles from in-process values"""
+
+    @classmethod
+    def from_trusted(cls: Type[_ModelT], **data: Any) -> _ModelT:
+        """
+        Build an instance without running validators.
+
+        Only for values produced in-process (session ids, timestamps, paths,
+        already-built sub-models) - LLM output must still go through
+        normal validation.
+        """
+        return cls.model_construct(**data)
+
 
 class TaskSummaryOutput(BaseModel):
     """AI-generated task summary for session ID"""
@@ -20,7 +37,7 @@ class TaskSummaryOutput(BaseModel):
     focus_areas: List[str] = Field(description="Main areas this task will focus on")
 
 
-class ScribeSessionCreationOutput(BaseModel):
+class ScribeSessionCreationOutput(_TrustedConstructible):
     """Output from session creation"""
 
     session_id: str = Field(description="Generated session identifier")
@@ -34,26 +51,26 @@ class ScribeSessionCreationOutput(BaseModel):
 class SynthesisOverview(BaseModel):
     """High-level synthesis facets for scribe output"""
 
-    consensus: List[str] = []
-    conflicts: List[str] = []
-    themes: List[str] = []
+    consensus: List[str] = Field(default_factory=list)
+    conflicts: List[str] = Field(default_factory=list)
+    themes: List[str] = Field(default_factory=list)
 
 
-class ScribeSynthesisOutput(BaseModel):
+class ScribeSynthesisOutput(_TrustedConstructible):
     """Output from synthesis process"""
 
     session_id: str = Field(description="Session identifier")
     timestamp: str = Field(description="ISO timestamp of synthesis")
     status: str = Field(description="Synthesis status")
     synthesis_markdown: str = Field(description="Generated synthesis content")
-    synthesis_overview: SynthesisOverview = SynthesisOverview()
+    synthesis_overview: SynthesisOverview = Field(default_factory=SynthesisOverview)
     sources: Dict[str, Any] = Field(
         default_factory=dict,
         description="Optional mapping of source filenames to key points used",
     )
 
 
-class ScribeOutput(BaseModel):
+class ScribeOutput(_TrustedConstructible):
     """Unified Scribe worker output for create, synthesis_setup, and synthesis modes"""
 
     mode: Literal["create", "synthesis_setup", "synthesis"] = Field(
@@ -4,28 +4,118 @@ Scribe Worker Runner
 Execution runner for the Scribe Worker - provides session lifecycle management and synthesis.
 """
 
+import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
-
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+# Ensure imports work when run directly or from CLI
+current_dir = Path(__file__).parent
+pydantic_ai_root = current_dir.parent
+if str(pydantic_ai_root) not in sys.path:
+    sys.path.insert(0, str(pydantic_ai_root))
+
 from pydantic_ai import Agent
 from pydantic_ai.models import ModelSettings
-from typing import List
-from scribe.models import TaskSummaryOutput
+from scribe.models import TaskSummaryOutput, ScribeOutput, SynthesisOverview
+from scribe.agent import ScribeAgentConfig
 from shared.base_worker import BaseWorker
 from shared.tools import iso_now
 from shared.protocols import SessionManagement
-from scribe.models import ScribeOutput, SynthesisOverview
-from scribe.agent import ScribeAgentConfig
-
 from shared.protocols.worker_prompt_templates import format_scribe_prompt
 
-# Ensure imports work when run directly or from CLI
-current_dir = Path(__file__).parent
-pydantic_ai_root = current_dir.parent
-if str(pydantic_ai_root) not in sys.path:
-    sys.path.insert(0, str(pydantic_ai_root))
+# Install layout is <project>/.claude/agents/pydantic_ai, resolved once at import
+_SESSIONS_DIR = pydantic_ai_root.parents[2] / "Docs" / "hive-mind" / "sessions"
+_TEMPLATES_DIR = current_dir / "templates"
+
+
+@lru_cache(maxsize=None)
+def _read_template(template_name: str) -> str:
+    """Read a static scribe template from templates/ (cached per process)"""
+    with open(_TEMPLATES_DIR / template_name, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+# Synthesis keyword tables, scanned in a single case-insensitive regex pass
+_THEME_MAPPING = {
+    "security": "Security Analysis",
+    "performance": "Performance Optimization",
+    "architecture": "Architecture Assessment",
+    "devops": "Infrastructure & DevOps",
+    "infrastructure": "Infrastructure & DevOps",
+}
+_CONFLICT_INDICATORS = {
+    "conflict": "Cross-domain conflicts identified",
+    "priority": "Prioritization required",
+    "tradeoff": "Technical tradeoffs identified",
+    "dependency": "Implementation dependencies mapped",
+}
+
+
+def _compile_keyword_union(keywords) -> "re.Pattern[str]":
+    """Compile keywords into one alternation with a named group per keyword"""
+    return re.compile(
+        "|".join(f"(?P<k{i}>{re.escape(k)})" for i, k in enumerate(keywords)),
+        re.IGNORECASE,
+    )
+
+
+_PLACEHOLDER_KEYWORDS = (
+    "todo",
+    "fixme",
+    "placeholder",
+    "analysis needed",
+    "content here",
+)
+_REQUIRED_SECTIONS = ("executive summary", "critical issues", "recommendations")
+
+# Group k{i} of each pattern matched keywords[i] of the tuple beside it
+_THEME_KEYWORDS = tuple(_THEME_MAPPING)
+_CONFLICT_KEYWORDS = tuple(_CONFLICT_INDICATORS)
+
+_THEME_PATTERN = _compile_keyword_union(_THEME_KEYWORDS)
+_CONFLICT_PATTERN = _compile_keyword_union(_CONFLICT_KEYWORDS)
+_PLACEHOLDER_PATTERN = _compile_keyword_union(_PLACEHOLDER_KEYWORDS)
+_SECTION_PATTERN = _compile_keyword_union(_REQUIRED_SECTIONS)
+_SYNTHESIS_MODE_PATTERN = re.compile("synthesis", re.IGNORECASE)
+
+
+def _prompt_cache_settings(model: str) -> ModelSettings | None:
+    """Model settings marking the static system prompt as cacheable, if needed.
+
+    Anthropic and Bedrock only cache prompt prefixes at explicit breakpoints;
+    other providers cache repeated prefixes implicitly and need no settings.
+    """
+    if model.startswith("anthropic:"):
+        return ModelSettings(anthropic_cache_instructions=True)
+    if model.startswith("bedrock:"):
+        return ModelSettings(bedrock_cache_instructions=True)
+    return None
+
+
+@lru_cache(maxsize=8)
+def _get_session_id_agent(model: str) -> Agent:
+    """Return the session ID assessment agent for model, built once per model"""
+    if model.startswith("custom:"):
+        # Use ModelSettings to pass outputStyle settings
+        return Agent(
+            model=model,
+            output_type=TaskSummaryOutput,
+            model_settings=ModelSettings(
+                extra_headers={"X-Settings": r'{"outputStyle": "scribe-json"}'}
+            ),
+            # NO system prompt for custom models - let Docker agent handle it
+        )
+
+    return Agent(
+        model=model,
+        output_type=TaskSummaryOutput,
+        system_prompt=ScribeAgentConfig.get_system_prompt(),
+        model_settings=_prompt_cache_settings(model),
+    )
 
 
 class ScribeWorker(BaseWorker):
@@ -42,6 +132,9 @@ class ScribeWorker(BaseWorker):
             worker_config=None,
         )
 
+        # One ISO timestamp per phase, shared by its output and markdown files
+        self._run_timestamp = None
+
         # Initialize path attributes
         self.project_root_path = Path(SessionManagement.detect_project_root())
         self.sessions_dir = self.project_root_path / "Docs" / "hive-mind" / "sessions"
@@ -50,6 +143,7 @@ class ScribeWorker(BaseWorker):
         self, session_id: str, task_description: str, model: str
     ) -> ScribeOutput:
         """Execute session creation (called only by CLI --create mode)."""
+        self._run_timestamp = iso_now()
         actual_session_id, complexity_level = self._generate_ai_session_id(
             task_description, model
         )
@@ -70,37 +164,40 @@ class ScribeWorker(BaseWorker):
     ) -> ScribeOutput:
         """Create completion result for session creation"""
         self.update_session_config(session_id)
-        self.log_event(
-            "worker_spawned",
-            {
-                "worker_type": "scribe",
-                "mode": "create",
-                "purpose": "session_creation",
-            },
-            "INFO",
-        )
 
-        session_full_path = Path(SessionManagement.get_session_path(session_id))
-        relative_session_path = str(
-            session_full_path.relative_to(self.project_root_path)
-        )
+        # worker_spawned and session_created reach EVENTS.jsonl in one append
+        with self.batch_logs():
+            self.log_event(
+                "worker_spawned",
+                {
+                    "worker_type": "scribe",
+                    "mode": "create",
+                    "purpose": "session_creation",
+                },
+                "INFO",
+            )
 
-        # Log session creation event
-        self.log_event(
-            "session_created",
-            {
-                "session_id": session_id,
-                "task_description": task_description,
-                "session_path": relative_session_path,
-                "generated_by": "scribe",
-            },
-            "INFO",
-        )
+            session_full_path = self.sessions_dir / session_id
+            relative_session_path = str(
+                session_full_path.relative_to(self.project_root_path)
+            )
+
+            # Log session creation event
+            self.log_event(
+                "session_created",
+                {
+                    "session_id": session_id,
+                    "task_description": task_description,
+                    "session_path": relative_session_path,
+                    "generated_by": "scribe",
+                },
+                "INFO",
+            )
 
-        return ScribeOutput(
+        return ScribeOutput.from_trusted(
             mode="create",
             session_id=session_id,
-            timestamp=iso_now(),
+            timestamp=self._run_timestamp,
             status="completed",
             task_description=task_description,
             complexity_level=complexity_level,
@@ -110,27 +207,32 @@ class ScribeWorker(BaseWorker):
     def run_setup_phase(self, session_id: str, model: str) -> ScribeOutput:
         """Phase 1: Setup & Data Collection for creative synthesis"""
         self.update_session_config(session_id)
+        self._run_timestamp = iso_now()
 
         # Validate session exists
-        project_root_path = Path(__file__).parent.parent.parent.parent.parent
-        sessions_dir = project_root_path / "Docs" / "hive-mind" / "sessions"
-        session_path = sessions_dir / session_id
+        session_path = _SESSIONS_DIR / session_id
 
-        if not session_path.exists():
+        if not os.path.isdir(session_path):
             raise FileNotFoundError(f"Session {session_id} not found")
 
         # Collect worker file paths for Claude Code
         worker_inventory = self._collect_worker_file_inventory(session_path)
 
-        self._create_synthesis_prompt_file(session_id, session_path, worker_inventory)
-        self._create_synthesis_template_file(session_id, session_path, worker_inventory)
+        # Both file creation debug entries share a single DEBUG.jsonl append
+        with self.batch_logs():
+            self._create_synthesis_prompt_file(
+                session_id, session_path, worker_inventory
+            )
+            self._create_synthesis_template_file(
+                session_id, session_path, worker_inventory
+            )
 
         # Return setup output with file paths
-        return ScribeOutput(
+        return ScribeOutput.from_trusted(
             mode="synthesis_setup",
             session_id=session_id,
             session_path=str(session_path),
-            timestamp=iso_now(),
+            timestamp=self._run_timestamp,
             status="setup_completed",
             worker_file_paths=worker_inventory["file_paths"],
             sources=worker_inventory["sources"],
@@ -144,13 +246,14 @@ class ScribeWorker(BaseWorker):
         session_path = self.sessions_dir / session_id
         synthesis_file = session_path / "SYNTHESIS.md"
 
-        if not synthesis_file.exists():
+        # Read the synthesis content created by Claude Code; a missing file
+        # surfaces from the read itself rather than a separate stat first
+        try:
+            synthesis_content = synthesis_file.read_text()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Creative synthesis file not found: {synthesis_file}"
-            )
-
-        # Read the synthesis content created by Claude Code
-        synthesis_content = synthesis_file.read_text()
+            ) from None
         validation_result = self._validate_synthesis_completeness(synthesis_content)
 
         if not validation_result["valid"]:
@@ -165,32 +268,7 @@ class ScribeWorker(BaseWorker):
             themes=validation_result.get("themes", ["Creative architectural analysis"]),
         )
 
-        # Create output files for synthesis mode
-        try:
-            self.create_output_files_base(
-                session_id,
-                ScribeOutput(
-                    mode="synthesis",
-                    session_id=session_id,
-                    timestamp=iso_now(),
-                    status="completed",
-                    synthesis_markdown=synthesis_content,
-                    synthesis_overview=synthesis_overview,
-                    sources={
-                        "synthesis_file": str(
-                            synthesis_file.relative_to(self.project_root_path)
-                        )
-                    },
-                ),
-                self.get_file_prefix(),
-            )
-        except Exception as e:
-            self.log_debug(
-                f"File creation failed during output phase: {e}", level="ERROR"
-            )
-
-        # Return completed synthesis output
-        return ScribeOutput(
+        output = ScribeOutput.from_trusted(
             mode="synthesis",
             session_id=session_id,
             timestamp=iso_now(),
@@ -204,6 +282,17 @@ class ScribeWorker(BaseWorker):
             },
         )
 
+        # Create output files for synthesis mode
+        try:
+            self.create_output_files_base(session_id, output, self.get_file_prefix())
+        except Exception as e:
+            self.log_debug(
+                f"File creation failed during output phase: {e}", level="ERROR"
+            )
+
+        # Return completed synthesis output
+        return output
+
     def _collect_worker_file_inventory(self, session_path: Path) -> Dict[str, Any]:
         """Collect file paths for Claude Code creative analysis"""
 
@@ -211,26 +300,22 @@ class ScribeWorker(BaseWorker):
         notes_dir = workers_dir / "notes"
         json_dir = workers_dir / "json"
 
-        print(notes_dir, json_dir)
-
         file_paths = []
         sources = {}
         worker_count = 0
 
         # Collect notes files
-        if notes_dir.exists():
-            for notes_file in notes_dir.glob("*_notes.md"):
-                worker_type = notes_file.stem.replace("_notes", "")
-                file_paths.append(str(notes_file))
-                sources[f"{worker_type}_notes"] = str(notes_file)
-                worker_count += 1
+        for notes_file in self._scan_worker_files(notes_dir, "_notes.md"):
+            worker_type = notes_file.name[: -len("_notes.md")]
+            file_paths.append(notes_file.path)
+            sources[f"{worker_type}_notes"] = notes_file.path
+            worker_count += 1
 
         # Collect JSON files
-        if json_dir.exists():
-            for json_file in json_dir.glob("*_output.json"):
-                worker_type = json_file.stem.replace("_output", "")
-                file_paths.append(str(json_file))
-                sources[f"{worker_type}_json"] = str(json_file)
+        for json_file in self._scan_worker_files(json_dir, "_output.json"):
+            worker_type = json_file.name[: -len("_output.json")]
+            file_paths.append(json_file.path)
+            sources[f"{worker_type}_json"] = json_file.path
 
         return {
             "file_paths": file_paths,
@@ -239,6 +324,23 @@ class ScribeWorker(BaseWorker):
             "session_path": str(session_path),
         }
 
+    @staticmethod
+    def _scan_worker_files(directory: Path, suffix: str) -> List[os.DirEntry]:
+        """List regular files in directory ending with suffix (empty if missing).
+
+        One scandir pass - DirEntry carries the file type, so there are no
+        separate exists()/is_file() stat calls per entry.
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return [
+                    entry
+                    for entry in entries
+                    if entry.name.endswith(suffix) and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return []
+
     def _validate_synthesis_completeness(
         self, synthesis_content: str
     ) -> Dict[str, Any]:
@@ -268,22 +370,17 @@ class ScribeWorker(BaseWorker):
     def _check_placeholder_patterns(self, content: str) -> List[str]:
         """Check for remaining placeholder patterns"""
         errors = []
-        content_lower = content.lower()
 
         # Template variable patterns
         if "{" in content and "}" in content:
             errors.append("Found template variable placeholders")
 
         # Common placeholder keywords
-        placeholder_keywords = [
-            "todo",
-            "fixme",
-            "placeholder",
-            "analysis needed",
-            "content here",
-        ]
-        for keyword in placeholder_keywords:
-            if keyword in content_lower:
+        found = self._find_keywords(
+            _PLACEHOLDER_PATTERN, _PLACEHOLDER_KEYWORDS, content
+        )
+        for keyword in _PLACEHOLDER_KEYWORDS:
+            if keyword in found:
                 errors.append(f"Found placeholder keyword: {keyword}")
 
         # Markdown placeholder sections
@@ -306,11 +403,9 @@ class ScribeWorker(BaseWorker):
             )
 
         # Section completeness check
-        required_sections = ["executive summary", "critical issues", "recommendations"]
-        content_lower = content.lower()
-
+        found = self._find_keywords(_SECTION_PATTERN, _REQUIRED_SECTIONS, content)
         missing_sections = [
-            section for section in required_sections if section not in content_lower
+            section for section in _REQUIRED_SECTIONS if section not in found
         ]
 
         if missing_sections:
@@ -318,39 +413,36 @@ class ScribeWorker(BaseWorker):
 
         return errors
 
+    @staticmethod
+    def _find_keywords(
+        pattern: "re.Pattern[str]", keywords: tuple, content: str
+    ) -> set:
+        """Return the keywords found in content from one pass of their union pattern"""
+        found = set()
+        for match in pattern.finditer(content):
+            found.add(keywords[int(match.lastgroup[1:])])
+            if len(found) == len(keywords):
+                break
+        return found
+
     def _extract_content_themes(self, content: str) -> List[str]:
         """Extract themes based on content analysis"""
-        content_lower = content.lower()
+        found = self._find_keywords(_THEME_PATTERN, _THEME_KEYWORDS, content)
         themes = []
 
-        theme_mapping = {
-            "security": "Security Analysis",
-            "performance": "Performance Optimization",
-            "architecture": "Architecture Assessment",
-            "devops": "Infrastructure & DevOps",
-            "infrastructure": "Infrastructure & DevOps",
-        }
-
-        for keyword, theme in theme_mapping.items():
-            if keyword in content_lower and theme not in themes:
+        for keyword, theme in _THEME_MAPPING.items():
+            if keyword in found and theme not in themes:
                 themes.append(theme)
 
         return themes if themes else ["Comprehensive Analysis"]
 
     def _extract_content_conflicts(self, content: str) -> List[str]:
         """Extract conflicts and priority indicators"""
-        content_lower = content.lower()
+        found = self._find_keywords(_CONFLICT_PATTERN, _CONFLICT_KEYWORDS, content)
         conflicts = []
 
-        conflict_indicators = {
-            "conflict": "Cross-domain conflicts identified",
-            "priority": "Prioritization required",
-            "tradeoff": "Technical tradeoffs identified",
-            "dependency": "Implementation dependencies mapped",
-        }
-
-        for indicator, description in conflict_indicators.items():
-            if indicator in content_lower and description not in conflicts:
+        for indicator, description in _CONFLICT_INDICATORS.items():
+            if indicator in found and description not in conflicts:
                 conflicts.append(description)
 
         return conflicts if conflicts else ["No major conflicts"]
@@ -362,29 +454,13 @@ class ScribeWorker(BaseWorker):
         timestamp = datetime.utcnow().strftime("%Y-%m-%d-%H-%M")
 
         try:
+            temp_agent = _get_session_id_agent(model)
+
             if model.startswith("custom:"):
                 scribe_prompt = f"""Using the Scribe Agent, generate a session ID and complexity assessment for this task: "{task_description}" """
 
-                # Use ModelSettings to pass outputStyle settings
-                model_settings = ModelSettings(
-                    extra_headers={"X-Settings": r'{"outputStyle": "scribe-json"}'}
-                )
-
-                temp_agent = Agent(
-                    model=model,
-                    output_type=TaskSummaryOutput,
-                    model_settings=model_settings,
-                    # NO system prompt for custom models - let Docker agent handle it
-                )
-
                 complexity_data = temp_agent.run_sync(scribe_prompt)
             else:
-                temp_agent = Agent(
-                    model=model,
-                    output_type=TaskSummaryOutput,
-                    system_prompt=ScribeAgentConfig.get_system_prompt(),
-                )
-
                 complexity_data = temp_agent.run_sync(task_description)
 
             session_id = f"{timestamp}-{complexity_data.output.short_description}"
@@ -406,21 +482,21 @@ class ScribeWorker(BaseWorker):
 
     def _create_session_directory(self, session_id: str):
         """Create session directory structure"""
-        session_path = self.sessions_dir / session_id
+        session_path = os.path.join(self.sessions_dir, session_id)
 
-        session_path.mkdir(parents=True, exist_ok=True)
-        (session_path / "workers").mkdir(exist_ok=True)
-        (session_path / "workers" / "notes").mkdir(exist_ok=True)
-        (session_path / "workers" / "prompts").mkdir(exist_ok=True)
-        (session_path / "workers" / "json").mkdir(exist_ok=True)
+        # makedirs creates the session root and workers/ along the way
+        for subdir in ("notes", "prompts", "json"):
+            os.makedirs(os.path.join(session_path, "workers", subdir), exist_ok=True)
 
         # Create session files - only EVENTS.jsonl, DEBUG.jsonl, BACKLOG.jsonl (no STATE.json)
-        events_file = session_path / "EVENTS.jsonl"
-        events_file.touch()
-        debug_file = session_path / "DEBUG.jsonl"
-        debug_file.touch()
-        backlog_file = session_path / "BACKLOG.jsonl"
-        backlog_file.touch()
+        for file_name in ("EVENTS.jsonl", "DEBUG.jsonl", "BACKLOG.jsonl"):
+            os.close(
+                os.open(
+                    os.path.join(session_path, file_name),
+                    os.O_WRONLY | os.O_CREAT | os.O_CLOEXEC,
+                    0o666,
+                )
+            )
 
     def _create_session_markdown(
         self, session_id: str, task_description: str, model: str
@@ -432,14 +508,13 @@ class ScribeWorker(BaseWorker):
             "session.md",
             {
                 "session_id": session_id,
-                "timestamp": iso_now(),
+                "timestamp": self._run_timestamp,
                 "task_description": task_description,
                 "model": model,
             },
         )
 
-        with open(session_path / "SESSION.md", "w") as f:
-            f.write(session_md_content)
+        (session_path / "SESSION.md").write_bytes(session_md_content.encode("utf-8"))
 
     def _create_synthesis_prompt_file(
         self, session_id: str, session_path: Path, worker_inventory: Dict[str, Any]
@@ -454,13 +529,10 @@ class ScribeWorker(BaseWorker):
         prompts_dir.mkdir(parents=True, exist_ok=True)
 
         prompt_file = prompts_dir / "scribe-synthesis.prompt"
-        with open(prompt_file, "w") as f:
-            f.write(synthesis_prompt)
+        prompt_file.write_bytes(synthesis_prompt.encode("utf-8"))
 
         # Log prompt file creation
-        project_root = Path(SessionManagement.detect_project_root())
-        relative_path = prompt_file.relative_to(project_root)
-        log_path = str(relative_path)
+        log_path = str(prompt_file.relative_to(self.project_root_path))
 
         self.log_debug(
             "Created synthesis prompt file for Claude Code",
@@ -477,7 +549,7 @@ class ScribeWorker(BaseWorker):
 
         template_variables = {
             "session_id": session_id,
-            "timestamp": iso_now(),
+            "timestamp": self._run_timestamp,
             "workers_count": str(worker_inventory["worker_count"]),
         }
 
@@ -488,16 +560,11 @@ class ScribeWorker(BaseWorker):
 
         # Write template to session directory
         synthesis_file = session_path / "SYNTHESIS.md"
-        with open(synthesis_file, "w") as f:
-            f.write(synthesis_content)
+        synthesis_file.write_bytes(synthesis_content.encode("utf-8"))
 
         # Log template creation
         try:
-            from shared.protocols import SessionManagement
-
-            project_root = Path(SessionManagement.detect_project_root())
-            relative_path = synthesis_file.relative_to(project_root)
-            log_path = str(relative_path)
+            log_path = str(synthesis_file.relative_to(self.project_root_path))
         except Exception:
             log_path = str(synthesis_file)
 
@@ -519,11 +586,8 @@ class ScribeWorker(BaseWorker):
         Returns:
             Template content with variables substituted
         """
-        template_path = Path(__file__).parent / "templates" / template_name
         try:
-            with open(template_path, "r") as f:
-                template_content = f.read()
-            return template_content.format(**variables)
+            return _read_template(template_name).format_map(variables)
         except FileNotFoundError:
             raise FileNotFoundError(
                 f"Template file {template_name} not found in templates directory"
@@ -564,7 +628,12 @@ class ScribeWorker(BaseWorker):
         Returns:
             Event details for analysis started logging
         """
-        mode = "synthesis" if "synthesis" in task_description.lower() else "create"
+        # Caseless search, so the task text is not copied just to lowercase it
+        mode = (
+            "synthesis"
+            if _SYNTHESIS_MODE_PATTERN.search(task_description)
+            else "create"
+        )
         return {
             "worker": "scribe",
             "mode": mode,
@@ -639,48 +708,51 @@ class ScribeWorker(BaseWorker):
     ) -> None:
         """Override to skip file creation for session creation mode"""
         if output.mode == "create":
-            # Only create worker-specific files (SESSION.md, etc.) but no JSON/notes output
-            session_path = Path(SessionManagement.get_session_path(session_id))
-            self.create_worker_specific_files(session_id, output, session_path)
+            # SESSION.md is written by _create_session_markdown and the scribe
+            # has no create-mode worker files, so there is no JSON/notes output
             return
 
         # For synthesis mode, create full output files
-        try:
-            session_path = Path(SessionManagement.get_session_path(session_id))
-            notes_dir = session_path / "workers" / "notes"
-            json_dir = session_path / "workers" / "json"
-            notes_dir.mkdir(parents=True, exist_ok=True)
-            json_dir.mkdir(parents=True, exist_ok=True)
-
-            # Create notes file if content provided
-            if hasattr(output, "notes_markdown") and output.notes_markdown:
-                notes_file = notes_dir / f"{file_prefix}_notes.md"
-                notes_file.write_text(output.notes_markdown)
-                relative_path = notes_file.relative_to(self.project_root_path)
+        # Debug entries for every file below go out in one DEBUG.jsonl append
+        with self.batch_logs():
+            try:
+                session_path = self.sessions_dir / session_id
+                notes_dir = session_path / "workers" / "notes"
+                json_dir = session_path / "workers" / "json"
+                notes_dir.mkdir(parents=True, exist_ok=True)
+                json_dir.mkdir(parents=True, exist_ok=True)
+
+                # Create notes file if content provided
+                if hasattr(output, "notes_markdown") and output.notes_markdown:
+                    notes_file = notes_dir / f"{file_prefix}_notes.md"
+                    notes_file.write_text(output.notes_markdown)
+                    relative_path = notes_file.relative_to(self.project_root_path)
+                    self.log_debug(
+                        f"Created {file_prefix} notes file",
+                        {"path": str(relative_path)},
+                    )
+
+                # Create structured output JSON
+                output_file = json_dir / f"{file_prefix}_output.json"
+                output_file.write_text(
+                    output.model_dump_json(indent=2), encoding="utf-8"
+                )
+                relative_path = output_file.relative_to(self.project_root_path)
                 self.log_debug(
-                    f"Created {file_prefix} notes file",
+                    f"Created {file_prefix} output JSON",
                     {"path": str(relative_path)},
                 )
 
-            # Create structured output JSON
-            output_file = json_dir / f"{file_prefix}_output.json"
-            output_file.write_text(output.model_dump_json(indent=2))
-            relative_path = output_file.relative_to(self.project_root_path)
-            self.log_debug(
-                f"Created {file_prefix} output JSON",
-                {"path": str(relative_path)},
-            )
-
-            # Allow worker-specific file creation
-            self.create_worker_specific_files(session_id, output, session_path)
+                # Allow worker-specific file creation
+                self.create_worker_specific_files(session_id, output, session_path)
 
-        except Exception as e:
-            self.log_debug(
-                "File creation failed",
-                {"error": str(e)},
-                "ERROR",
-            )
-            raise
+            except Exception as e:
+                self.log_debug(
+                    "File creation failed",
+                    {"error": str(e)},
+                    "ERROR",
+                )
+                raise
 
     def create_worker_specific_files(
         self, session_id: str, output: ScribeOutput, session_path: Path
@@ -695,8 +767,7 @@ class ScribeWorker(BaseWorker):
         # For synthesis mode, create the synthesis markdown file
         if output.mode == "synthesis" and output.synthesis_markdown:
             synthesis_file = session_path / "SYNTHESIS.md"
-            with open(synthesis_file, "w") as f:
-                f.write(output.synthesis_markdown)
+            synthesis_file.write_bytes(output.synthesis_markdown.encode("utf-8"))
 
             relative_path = synthesis_file.relative_to(self.project_root_path)
 
@@ -58,31 +58,20 @@ class BaseAgentConfig(ABC):
     @classmethod
     def get_worker_config(cls) -> WorkerConfig:
         """Create standardized worker configuration"""
-        return WorkerConfig(
-            worker_type=cls.get_worker_type(),
-            session_id="",  # Set at runtime
-            task_description="",  # Set at runtime
-            tag_access=WorkerTagMapping.get_tags_for_worker(cls.get_worker_type()),
-            escalation_timeout=300,
-            escalation_chain=["queen-orchestrator"],
-            complexity_level=2,
-            dependencies=[],
-            priority="medium",
-        )
+        # Session and task are set at runtime
+        return cls.create_worker_config(session_id="", task_description="")
 
     @classmethod
     def create_worker_config(cls, session_id: str, task_description: str) -> WorkerConfig:
         """Create worker configuration with runtime values"""
+        # Escalation, complexity, dependencies and priority use the shared
+        # WorkerConfig field defaults; only per-worker values are passed here
+        worker_type = cls.get_worker_type()
         return WorkerConfig(
-            worker_type=cls.get_worker_type(),
+            worker_type=worker_type,
             session_id=session_id,
             task_description=task_description,
-            tag_access=WorkerTagMapping.get_tags_for_worker(cls.get_worker_type()),
-            escalation_timeout=300,
-            escalation_chain=["queen-orchestrator"],
-            complexity_level=2,
-            dependencies=[],
-            priority="medium",
+            tag_access=WorkerTagMapping.get_tags_for_worker(worker_type),
         )
 
     @classmethod
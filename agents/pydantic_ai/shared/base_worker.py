@@ -6,11 +6,11 @@ framework with protocol compliance, session management, and extensible
 worker-specific behavior.
 """
 
-import argparse
 import traceback
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
 from abc import ABC, abstractmethod
 
 from .protocols import (
@@ -24,6 +24,20 @@ from .models import WorkerSummary, WorkerOutput
 from .worker_config import WorkerConfig
 from .tools import iso_now
 
+if TYPE_CHECKING:
+    import argparse
+
+# Root holding the per-worker packages (and their templates/ directories)
+_WORKERS_ROOT = Path(__file__).parent.parent
+
+
+@lru_cache(maxsize=None)
+def _load_worker_template(file_prefix: str, template_name: str) -> str:
+    """Load a static worker template from <worker>/templates/ (cached)"""
+    template_path = _WORKERS_ROOT / file_prefix / "templates" / template_name
+    with open(template_path, "r", encoding="utf-8") as f:
+        return f.read()
+
 
 class BaseWorker(BaseProtocol, ABC):
     """
@@ -55,9 +69,7 @@ class BaseWorker(BaseProtocol, ABC):
 
     def update_session_config(self, session_id: str) -> None:
         """Update the protocol configuration with actual session ID"""
-        self.config = ProtocolConfig(
-            {"session_id": session_id, "agent_name": self.worker_type}
-        )
+        self.config = ProtocolConfig.for_session(session_id, self.worker_type)
 
     def read_worker_prompt(self, session_id: str) -> str:
         """
@@ -73,11 +85,9 @@ class BaseWorker(BaseProtocol, ABC):
             String containing the prompt content for the Pydantic AI agent
         """
         try:
-            cfg = ProtocolConfig(
-                {"session_id": session_id, "agent_name": self.worker_type}
-            )
+            cfg = ProtocolConfig.for_session(session_id, self.worker_type)
 
-            self._prompt_protocol = WorkerManager(cfg.to_dict())
+            self._prompt_protocol = WorkerManager(cfg)
             prompt_content = self._prompt_protocol.read_prompt_file(self.worker_type)
 
             # Return the actual prompt content as string
@@ -107,8 +117,11 @@ class BaseWorker(BaseProtocol, ABC):
             self.log_debug("Session validation failed", {"error": str(e)}, "ERROR")
             raise
 
-    def create_cli_parser(self) -> argparse.ArgumentParser:
+    def create_cli_parser(self) -> "argparse.ArgumentParser":
         """Framework-enforced CLI argument parsing with worker-specific description"""
+        # Deferred so in-process callers (cli.py run_queen/run_scribe) skip argparse
+        import argparse
+
         parser = argparse.ArgumentParser(
             description=f"{self.get_worker_display_name()} - {self.get_worker_description()}"
         )
@@ -136,10 +149,10 @@ class BaseWorker(BaseProtocol, ABC):
 
         return parser
 
-    def run_cli_main(self) -> int:
-        """Framework-enforced CLI main function"""
+    def run_cli_main(self, argv: Optional[List[str]] = None) -> int:
+        """Framework-enforced CLI main function (argv defaults to sys.argv[1:])"""
         parser = self.create_cli_parser()
-        args = parser.parse_args()
+        args = parser.parse_args(argv)
 
         try:
             # Validate task parameter based on execution mode
@@ -230,24 +243,14 @@ class BaseWorker(BaseProtocol, ABC):
         notes_dir.mkdir(parents=True, exist_ok=True)
         json_dir.mkdir(parents=True, exist_ok=True)
 
-        # Load templates from worker/templates/
-        template_dir = (
-            Path(__file__).parent.parent / self.get_file_prefix() / "templates"
-        )
-
-        # Read markdown template
-        markdown_template_path = (
-            template_dir / f"{self.get_file_prefix()}_notes_template.md"
+        # Load templates from worker/templates/ (read once per process)
+        file_prefix = self.get_file_prefix()
+        markdown_content = _load_worker_template(
+            file_prefix, f"{file_prefix}_notes_template.md"
         )
-        with open(markdown_template_path, "r", encoding="utf-8") as f:
-            markdown_content = f.read()
-
-        # Read JSON template
-        json_template_path = (
-            template_dir / f"{self.get_file_prefix()}_output_template.json"
+        json_content = _load_worker_template(
+            file_prefix, f"{file_prefix}_output_template.json"
         )
-        with open(json_template_path, "r", encoding="utf-8") as f:
-            json_content = f.read()
 
         # Replace template variables
         current_time = datetime.now().isoformat()
@@ -257,14 +260,11 @@ class BaseWorker(BaseProtocol, ABC):
         json_content = json_content.replace("{{DURATION}}", "TBD")
 
         # Create the actual output files
-        notes_file = notes_dir / f"{self.get_file_prefix()}_notes.md"
-        json_file = json_dir / f"{self.get_file_prefix()}_output.json"
+        notes_file = notes_dir / f"{file_prefix}_notes.md"
+        json_file = json_dir / f"{file_prefix}_output.json"
 
-        with open(notes_file, "w", encoding="utf-8") as f:
-            f.write(markdown_content)
-
-        with open(json_file, "w", encoding="utf-8") as f:
-            f.write(json_content)
+        notes_file.write_bytes(markdown_content.encode("utf-8"))
+        json_file.write_bytes(json_content.encode("utf-8"))
 
         # Store config in instance for create_setup_output to use
         self._setup_config = {
@@ -310,14 +310,16 @@ class BaseWorker(BaseProtocol, ABC):
         Default implementation validates existing analysis files and confirms completion.
         Can be overridden by workers for custom output validation.
         """
-        # Validate that analysis files exist
-        self.validate_analysis_files(session_id)
-
-        # Log completion
-        self.log_event(
-            "outputs_completed",
-            {"validation_status": "completed"},
-        )
+        # Validation debug entries and the completion event flush together
+        with self.batch_logs():
+            # Validate that analysis files exist
+            self.validate_analysis_files(session_id)
+
+            # Log completion
+            self.log_event(
+                "outputs_completed",
+                {"validation_status": "completed"},
+            )
 
         # Create a validation output
         return self.create_output_validation(session_id)
@@ -353,6 +355,11 @@ class BaseWorker(BaseProtocol, ABC):
         config = getattr(self, "_setup_config", {})
         worker_prompt = config.get("queen_prompt", "No prompt available")
 
+        # Resolve template file names once for both the summary and the notes
+        file_prefix = self.get_file_prefix()
+        notes_name = f"{file_prefix}_notes.md"
+        json_name = f"{file_prefix}_output.json"
+
         return WorkerOutput(
             session_id=session_id,
             worker=self.worker_type,
@@ -362,14 +369,14 @@ class BaseWorker(BaseProtocol, ABC):
                 key_findings=[
                     "Setup phase completed successfully",
                     "Queen-generated prompt loaded",
-                    f"Template files created: {self.get_file_prefix()}_notes.md and {self.get_file_prefix()}_output.json",
+                    f"Template files created: {notes_name} and {json_name}",
                 ],
                 critical_issues=[],
                 recommendations=[
                     "Proceed to Phase 2: Modify template files with analysis findings and remove unused sections"
                 ],
             ),
-            notes_markdown=f"# {self.get_worker_display_name()} Setup Phase\n\nTemplate files created and ready for Phase 2 modification.\n\n## Files Created\n- Markdown: {self.get_file_prefix()}_notes.md\n- JSON: {self.get_file_prefix()}_output.json\n\n## Specific Task Instructions from Queen\n\n{worker_prompt}",
+            notes_markdown=f"# {self.get_worker_display_name()} Setup Phase\n\nTemplate files created and ready for Phase 2 modification.\n\n## Files Created\n- Markdown: {notes_name}\n- JSON: {json_name}\n\n## Specific Task Instructions from Queen\n\n{worker_prompt}",
             config=config,
         )
 
@@ -5,13 +5,13 @@ Custom Pydantic AI Model that bridges Agent() calls to Claude API service.
 Maintains standard Pydantic AI interface while using Claude Max subscription.
 """
 
+import json
 from datetime import datetime
 
 from pydantic_ai.messages import ModelMessage, ModelResponse, TextPart, ToolCallPart
 from pydantic_ai.models import Model, ModelRequestParameters
 from pydantic_ai.settings import ModelSettings
 from pydantic_ai.usage import RequestUsage
-import json
 
 from .api_service_client import ClaudeAPIServiceClient
 
@@ -54,9 +54,25 @@ class ClaudeMaxSubscriptionModel(Model):
             prompt, self._model_name, extra_headers
         )
 
-        # Try to parse as JSON first - if it works, return as ToolCallPart
-        try:
-            json_data = json.loads(response_text.strip())
+        usage = RequestUsage(
+            input_tokens=self._estimate_tokens(messages),
+            output_tokens=len(response_text.split()) if response_text else 0,
+        )
+
+        # JSON object responses become the final_result tool call; anything
+        # else, including malformed JSON, stays a TextPart. The brace check
+        # skips the parse attempt for plain-text responses
+        response_json = (
+            response_text.strip() if isinstance(response_text, str) else ""
+        )
+        json_data = None
+        if response_json.startswith("{") and response_json.endswith("}"):
+            try:
+                json_data = json.loads(response_json)
+            except json.JSONDecodeError:
+                pass
+
+        if isinstance(json_data, dict):
             return ModelResponse(
                 parts=[
                     ToolCallPart(
@@ -67,22 +83,16 @@ class ClaudeMaxSubscriptionModel(Model):
                 ],
                 model_name=self._model_name,
                 timestamp=datetime.now(),
-                usage=RequestUsage(
-                    input_tokens=self._estimate_tokens(messages),
-                    output_tokens=len(response_text.split()),
-                ),
-            )
-        except (json.JSONDecodeError, AttributeError) as e:
-            return ModelResponse(
-                parts=[TextPart(content=response_text)],
-                model_name=self._model_name,
-                timestamp=datetime.now(),
-                usage=RequestUsage(
-                    input_tokens=self._estimate_tokens(messages),
-                    output_tokens=len(response_text.split()),
-                ),
+                usage=usage,
             )
 
+        return ModelResponse(
+            parts=[TextPart(content=response_text)],
+            model_name=self._model_name,
+            timestamp=datetime.now(),
+            usage=usage,
+        )
+
     async def count_tokens(
         self,
         messages: list[ModelMessage],
@@ -6,7 +6,8 @@ Provides protocol configuration, validation, and base protocol implementation.
 """
 
 import re
-from typing import Dict, Any, List, Optional, Union, Callable
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional, Union, Callable, Iterator
 from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass, field
@@ -377,12 +378,31 @@ class ProtocolConfig:
         "prompt_text": "",
     }
 
+    # Validated configs keyed by (session_id, agent_name) - see for_session()
+    _session_configs: Dict[tuple, "ProtocolConfig"] = {}
+
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
         self._set_canonical_fields()  # Apply defaults first
         self._validate_config()  # Then validate
         self._resolve_session_path()
 
+    @classmethod
+    def for_session(cls, session_id: str, agent_name: str) -> "ProtocolConfig":
+        """
+        Get the validated config for a session/agent pair, building it once.
+
+        Configs are never mutated after construction, so workers re-binding to
+        the same session share one instance instead of re-running validation
+        and session path detection on every call.
+        """
+        key = (session_id, agent_name)
+        config = cls._session_configs.get(key)
+        if config is None:
+            config = cls({"session_id": session_id, "agent_name": agent_name})
+            cls._session_configs[key] = config
+        return config
+
     def _validate_config(self) -> None:
         """Validate configuration using comprehensive validation system"""
 
@@ -459,6 +479,9 @@ class BaseProtocol(ProtocolInterface, LoggingCapable, SessionAware):
     )
 
     def __init__(self, config: Dict[str, Any] = None):
+        # Pending session log writes while inside batch_logs(), keyed by stream
+        self._log_buffer: Optional[Dict[str, Dict[str, List[Dict[str, Any]]]]] = None
+
         if isinstance(config, ProtocolConfig):
             self.config = config
         else:
@@ -533,7 +556,12 @@ class BaseProtocol(ProtocolInterface, LoggingCapable, SessionAware):
 
         # Log to session if available
         if self.config.session_id:
-            SessionManagement.append_to_events(self.config.session_id, event)
+            if self._log_buffer is not None:
+                self._log_buffer["events"].setdefault(
+                    self.config.session_id, []
+                ).append(event)
+            else:
+                SessionManagement.append_to_events(self.config.session_id, event)
 
         return event
 
@@ -553,10 +581,58 @@ class BaseProtocol(ProtocolInterface, LoggingCapable, SessionAware):
 
         # Log to session if available
         if self.config.session_id:
-            SessionManagement.append_to_debug(self.config.session_id, debug_entry)
+            if self._log_buffer is not None:
+                self._log_buffer["debug"].setdefault(
+                    self.config.session_id, []
+                ).append(debug_entry)
+            else:
+                SessionManagement.append_to_debug(self.config.session_id, debug_entry)
 
         return debug_entry
 
+    @contextmanager
+    def batch_logs(self) -> Iterator[None]:
+        """
+        Buffer session event/debug writes and flush each stream in one append.
+
+        Intended for short bursts of logging - avoid wrapping long-running
+        calls so EVENTS.jsonl stays close to real time. Buffered entries are
+        flushed even if the block raises, without masking that exception;
+        nested blocks defer to the outermost.
+        """
+        if self._log_buffer is not None:
+            yield
+            return
+
+        self._log_buffer = {"events": {}, "debug": {}}
+        try:
+            yield
+        except BaseException:
+            # The block's own exception wins over any flush failure
+            self._flush_log_buffer(suppress_errors=True)
+            raise
+        self._flush_log_buffer(suppress_errors=False)
+
+    def _flush_log_buffer(self, suppress_errors: bool) -> None:
+        """Write buffered entries with one append per stream and session"""
+        buffer, self._log_buffer = self._log_buffer, None
+        flush_error = None
+
+        for append_many, entries_by_session in (
+            (SessionManagement.append_many_to_events, buffer["events"]),
+            (SessionManagement.append_many_to_debug, buffer["debug"]),
+        ):
+            for session_id, entries in entries_by_session.items():
+                # A failed stream must not keep the others from being written
+                try:
+                    append_many(session_id, entries)
+                except Exception as e:
+                    if flush_error is None:
+                        flush_error = e
+
+        if flush_error is not None and not suppress_errors:
+            raise flush_error
+
     # SessionAware implementation
     @property
     def session_id(self) -> Optional[str]:
@@ -573,8 +649,6 @@ class BaseProtocol(ProtocolInterface, LoggingCapable, SessionAware):
         if not self.config.session_id:
             raise ValueError("Session ID is required for session-aware protocols")
 
-        from .session_management import SessionManagement
-
         return SessionManagement.ensure_session_exists(self.config.session_id)
 
     # Direct file operations (no interface abstraction needed)
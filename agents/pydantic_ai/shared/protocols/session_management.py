@@ -9,9 +9,10 @@ Includes environment variable loading utilities.
 
 import os
 import json
+import shutil
 import tempfile
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -24,29 +25,42 @@ def iso_now() -> str:
 class SessionManagement:
     """Core session management with guaranteed path consistency and atomic operations"""
 
+    # Detected project roots keyed by the working directory they were found from
+    _project_roots: Dict[str, str] = {}
+
     @staticmethod
     def detect_project_root() -> str:
         """
         Detect project root with guaranteed consistency.
         All agents MUST use this function for path detection.
 
+        The upward search runs once per working directory; later calls reuse
+        the result after a single check that the hive-mind directory remains.
+
         Returns absolute path to project root.
         """
+        cwd = os.getcwd()
+        cached_root = SessionManagement._project_roots.get(cwd)
+        if cached_root is not None and os.path.isdir(
+            os.path.join(cached_root, "Docs", "hive-mind")
+        ):
+            return cached_root
+
         # Start from current working directory
-        current_path = Path.cwd()
+        current_path = cwd
 
         # Search upward for project markers
-        while current_path != current_path.parent:
-            # Check for definitive project markers
-            if all(
-                [
-                    (current_path / "Docs" / "hive-mind").exists(),
-                    (current_path / ".claude").exists(),
-                ]
-            ):
-                return str(current_path)
-
-            current_path = current_path.parent
+        while current_path != os.path.dirname(current_path):
+            # Check for definitive project markers; .claude is only probed
+            # once Docs/hive-mind is found, so most levels cost a single stat
+            if os.path.exists(
+                os.path.join(current_path, "Docs", "hive-mind")
+            ) and os.path.exists(os.path.join(current_path, ".claude")):
+                project_root = current_path
+                SessionManagement._project_roots[cwd] = project_root
+                return project_root
+
+            current_path = os.path.dirname(current_path)
 
         # Log debug info before raising exception - attempt to write to temp location
         try:
@@ -152,17 +166,7 @@ class SessionManagement:
         Returns:
             True if append successful
         """
-        session_path = SessionManagement.get_session_path(session_id)
-        events_file = os.path.join(session_path, "EVENTS.jsonl")
-
-        # Ensure event has required fields
-        if "timestamp" not in event_data:
-            event_data["timestamp"] = iso_now()
-
-        # CRITICAL: Use append mode, never write mode - fail hard if this fails
-        with open(events_file, "a") as f:
-            f.write(json.dumps(event_data, separators=(",", ":")) + "\n")
-        return True
+        return SessionManagement.append_many_to_events(session_id, [event_data])
 
     @staticmethod
     def append_to_debug(session_id: str, debug_data: Dict[str, Any]) -> bool:
@@ -176,16 +180,95 @@ class SessionManagement:
         Returns:
             True if append successful
         """
+        return SessionManagement.append_many_to_debug(session_id, [debug_data])
+
+    @staticmethod
+    def append_many_to_events(
+        session_id: str, events: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        Append several events to EVENTS.jsonl with a single write.
+
+        Args:
+            session_id: Session identifier
+            events: Event dictionaries to append, in order
+
+        Returns:
+            True if append successful
+        """
+        return SessionManagement._append_jsonl(session_id, "EVENTS.jsonl", events)
+
+    @staticmethod
+    def append_many_to_debug(
+        session_id: str, debug_entries: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        Append several debug entries to DEBUG.jsonl with a single write.
+
+        Args:
+            session_id: Session identifier
+            debug_entries: Debug dictionaries to append, in order
+
+        Returns:
+            True if append successful
+        """
+        return SessionManagement._append_jsonl(
+            session_id, "DEBUG.jsonl", debug_entries
+        )
+
+    @staticmethod
+    def write_text_atomically(file_path: str, content: str) -> bool:
+        """
+        Replace a session file's content without exposing a partial write.
+
+        Content goes to a temp file in the same directory which is then
+        renamed over the target, so readers see either the old or new file.
+
+        Args:
+            file_path: File to replace
+            content: Full new file content
+
+        Returns:
+            True if write successful
+        """
+        directory = os.path.dirname(file_path) or "."
+        fd, temp_path = tempfile.mkstemp(
+            dir=directory, prefix=f".{os.path.basename(file_path)}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            # mkstemp creates 0600 files - keep the original file's permissions
+            if os.path.exists(file_path):
+                shutil.copymode(file_path, temp_path)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            # Never leave temp files behind in the session directory
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        return True
+
+    @staticmethod
+    def _append_jsonl(
+        session_id: str, file_name: str, entries: List[Dict[str, Any]]
+    ) -> bool:
+        """Serialize entries as JSON lines and append them in one write"""
         session_path = SessionManagement.get_session_path(session_id)
-        debug_file = os.path.join(session_path, "DEBUG.jsonl")
+        jsonl_file = os.path.join(session_path, file_name)
+
+        # Ensure every entry has a timestamp
+        for entry in entries:
+            if "timestamp" not in entry:
+                entry["timestamp"] = iso_now()
 
-        # Ensure debug has timestamp
-        if "timestamp" not in debug_data:
-            debug_data["timestamp"] = iso_now()
+        payload = "".join(
+            json.dumps(entry, separators=(",", ":")) + "\n" for entry in entries
+        ).encode("utf-8")
 
         # CRITICAL: Use append mode, never write mode - fail hard if this fails
-        with open(debug_file, "a") as f:
-            f.write(json.dumps(debug_data, separators=(",", ":")) + "\n")
+        with open(jsonl_file, "ab") as f:
+            f.write(payload)
         return True
 
 
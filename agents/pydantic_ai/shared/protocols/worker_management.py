@@ -17,6 +17,33 @@ from .protocol_interface import ProtocolMetadata
 from .worker_prompt_templates import load_template, format_template
 from .worker_prompt_templates.worker_configs import WORKER_CONFIGS
 
+# Fallback prompt for worker types without a template file
+_GENERIC_PROMPT_TEMPLATE = """You are a Technical Specialist with expertise in: {expertise}.
+
+TASK: {task_focus}
+
+Your mission: Analyze the assigned components and provide professional assessment based on your expertise.
+
+SCOPE:
+{context}
+
+EXPECTED DELIVERABLES:
+1. Worker Notes: Detailed analysis with professional recommendations  
+2. Worker Output: JSON with structured assessment results
+
+Focus on actionable insights within your area of expertise."""
+
+# Prompt file sections parsed as bullet/numbered lists vs. key-point context
+_LIST_SECTIONS = frozenset(
+    {
+        "success_criteria",
+        "available_tools",
+        "focus_areas_priority_order",
+        "worker_dependencies",
+    }
+)
+_CONTEXT_SECTIONS = frozenset({"codebase_context", "critical_risk_context"})
+
 
 @dataclass
 class WorkerSpec:
@@ -123,6 +150,8 @@ class WorkerManager(BaseProtocol):
             }
         super().__init__(config)
         self.prompt_data = None
+        # (codebase_insights list, formatted context) for the current prompt batch
+        self._context_cache = None
 
     def create_worker_prompts(self, worker_specs: List[WorkerSpec]) -> Dict[str, str]:
         """
@@ -136,7 +165,8 @@ class WorkerManager(BaseProtocol):
         os.makedirs(prompts_dir, exist_ok=True)
 
         created_files = {}
-        failed_prompts = []
+        # Specs from one plan share their insights list - format it only once
+        self._context_cache = None
 
         for spec in worker_specs:
             try:
@@ -150,14 +180,6 @@ class WorkerManager(BaseProtocol):
                 created_files[spec.worker_type] = prompt_file
 
             except Exception as e:
-                failed_prompts.append(
-                    {
-                        "exception_type": str(type(e)),
-                        "error": str(e),
-                        "worker_type": spec.worker_type,
-                    }
-                )
-
                 self.log_debug(
                     "worker_prompt_creation_failed",
                     {
@@ -200,11 +222,12 @@ class WorkerManager(BaseProtocol):
         Returns:
             String containing the Queen-generated prompt content.
         """
-        try:
-            # Get session path using unified session management
-            session_path = SessionManagement.get_session_path(self.config.session_id)
-            prompt_file_path = f"{session_path}/workers/prompts/{worker_type}.prompt"
+        # Get session path using unified session management - resolved before
+        # the try so the FileNotFoundError handler can always report the path
+        session_path = SessionManagement.get_session_path(self.config.session_id)
+        prompt_file_path = f"{session_path}/workers/prompts/{worker_type}.prompt"
 
+        try:
             # Read plain text prompt
             prompt_content = self._parse_prompt_content(prompt_file_path)
 
@@ -275,24 +298,22 @@ class WorkerManager(BaseProtocol):
             },
         )
 
-        context = self._get_relevant_context(spec)
-        return f"""You are a Technical Specialist with expertise in: {config.get('expertise', 'general analysis')}.
-
-TASK: {spec.task_focus}
-
-Your mission: Analyze the assigned components and provide professional assessment based on your expertise.
-
-SCOPE:
-{context}
-
-EXPECTED DELIVERABLES:
-1. Worker Notes: Detailed analysis with professional recommendations  
-2. Worker Output: JSON with structured assessment results
-
-Focus on actionable insights within your area of expertise."""
+        return _GENERIC_PROMPT_TEMPLATE.format_map(
+            {
+                "expertise": config.get("expertise", "general analysis"),
+                "task_focus": spec.task_focus,
+                "context": self._get_relevant_context(spec),
+            }
+        )
 
     def _get_relevant_context(self, spec: WorkerSpec) -> str:
         """Extract and format factual context for the worker (no analysis from Queen)"""
+        if (
+            self._context_cache is not None
+            and self._context_cache[0] is spec.codebase_insights
+        ):
+            return self._context_cache[1]
+
         context_parts = []
 
         if spec.codebase_insights:
@@ -315,11 +336,13 @@ Focus on actionable insights within your area of expertise."""
                         f"  Interactions: {', '.join(interactions[:2])}"
                     )
 
-        return (
+        context = (
             "\n".join(context_parts)
             if context_parts
             else "General system analysis required"
         )
+        self._context_cache = (spec.codebase_insights, context)
+        return context
 
     def _parse_prompt_content(self, file_path: str) -> str:
         """
@@ -375,22 +398,12 @@ Focus on actionable insights within your area of expertise."""
 
     def _process_section_content(self, section_name: str, content: str) -> Any:
         """Process section content based on section type"""
-        if section_name in [
-            "success_criteria",
-            "available_tools",
-            "focus_areas_priority_order",
-            "worker_dependencies",
-        ]:
+        if section_name in _LIST_SECTIONS:
             # List-based sections
             items = []
             for line in content.split("\n"):
                 line = line.strip()
-                if line and (
-                    line.startswith("- ")
-                    or line.startswith("1. ")
-                    or line.startswith("2. ")
-                    or line.startswith("3. ")
-                ):
+                if line and line.startswith(("- ", "1. ", "2. ", "3. ")):
                     # Remove list markers
                     item = re.sub(r"^[-\d\.]\s*", "", line).strip()
                     if item:
@@ -420,16 +433,12 @@ Focus on actionable insights within your area of expertise."""
                 "raw_content": content,
             }
 
-        elif section_name in ["codebase_context", "critical_risk_context"]:
+        elif section_name in _CONTEXT_SECTIONS:
             # Context sections - extract key points
             points = []
             for line in content.split("\n"):
                 line = line.strip()
-                if line and (
-                    line.startswith("- ")
-                    or line.startswith("**")
-                    or line.startswith("###")
-                ):
+                if line and line.startswith(("- ", "**", "###")):
                     points.append(line)
 
             return {"key_points": points, "full_content": content}
@@ -4,13 +4,17 @@ Worker Prompt Templates
 Centralized prompt templates for worker coordination and synthesis.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
+_TEMPLATES_DIR = Path(__file__).parent
 
+
+@lru_cache(maxsize=None)
 def load_scribe_template() -> str:
     """Load the scribe worker creative synthesis prompt template."""
-    template_path = Path(__file__).parent / "scribe-worker.txt"
+    template_path = _TEMPLATES_DIR / "scribe-worker.txt"
 
     try:
         with open(template_path, "r") as f:
@@ -35,10 +39,14 @@ def format_scribe_prompt(session_id: str, worker_inventory: Dict[str, Any]) -> s
     )
 
 
+@lru_cache(maxsize=None)
 def load_template(worker_type: str) -> str:
     """
     Load worker template from external file.
 
+    Templates ship with the package and are read once per process; every
+    worker of the same type reuses the cached content.
+
     Args:
         worker_type: Worker type (e.g., 'analyzer-worker', 'backend-worker')
 
@@ -48,7 +56,7 @@ def load_template(worker_type: str) -> str:
     Raises:
         FileNotFoundError: If template file doesn't exist (fail-hard behavior)
     """
-    template_path = Path(__file__).parent / f"{worker_type}.txt"
+    template_path = _TEMPLATES_DIR / f"{worker_type}.txt"
 
     if not template_path.exists():
         raise FileNotFoundError(f"Template file not found: {template_path}")
@@ -4,7 +4,10 @@ Shared Tools and Utilities
 Common functionality used across multiple agents.
 """
 
+import importlib
 from datetime import datetime
+from typing import Any, Callable, Iterable
+
 from .protocols import load_project_env
 
 # Load project environment on import
@@ -14,3 +17,32 @@ load_project_env()
 def iso_now() -> str:
     """Generate ISO timestamp string"""
     return datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def lazy_agent_getattr(
+    package: str, names: Iterable[str], submodule: str = ".agent"
+) -> Callable[[str], Any]:
+    """
+    Build a module-level __getattr__ (PEP 562) that resolves names from a
+    package's agent module on first access.
+
+    Building a pydantic-ai agent is deferred until the agent is first used,
+    so importing a worker package for its runner or models does not
+    construct agents it never calls.
+
+    Args:
+        package: __name__ of the package the __getattr__ is installed in
+        names: Attribute names served from the submodule
+        submodule: Relative module holding the attributes
+
+    Returns:
+        A __getattr__ function for the package
+    """
+    lazy_names = frozenset(names)
+
+    def __getattr__(name: str) -> Any:
+        if name in lazy_names:
+            return getattr(importlib.import_module(submodule, package), name)
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return __getattr__
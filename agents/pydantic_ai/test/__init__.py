@@ -4,8 +4,10 @@ Test Worker Package
 Testing strategy, quality assurance, and test coverage analysis specialist.
 """
 
-from .agent import test_agent
+from shared.tools import lazy_agent_getattr
 
 __all__ = [
     'test_agent',
-]
\ No newline at end of file
+]
+
+__getattr__ = lazy_agent_getattr(__name__, __all__)
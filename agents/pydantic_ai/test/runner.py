@@ -9,7 +9,9 @@ from pathlib import Path
 from typing import Dict, Any
 
 # Minimal path setup to enable shared imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+pydantic_ai_root = str(Path(__file__).parent.parent)
+if pydantic_ai_root not in sys.path:
+    sys.path.insert(0, pydantic_ai_root)
 
 from shared.base_worker import BaseWorker
 from shared.models import WorkerOutput
@@ -78,7 +80,7 @@ class TestWorker(BaseWorker):
         """
         return {
             "duration": "calculated",
-            "metrics": output.metrics.model_dump(),
+            "metrics": dict(output.metrics),
             "status": output.status,
         }
 
@@ -94,14 +96,17 @@ class TestWorker(BaseWorker):
         return f"Testing analysis completed successfully. Files analyzed: {output.metrics.items_analyzed}, Issues found: {output.metrics.issues_found}"
 
 
-def main():
+def main(argv=None):
     """CLI entry point for test worker execution.
 
+    Args:
+        argv: CLI arguments (defaults to sys.argv[1:])
+
     Returns:
         Exit code from worker execution
     """
     worker = TestWorker()
-    return worker.run_cli_main()
+    return worker.run_cli_main(argv)
 
 
 if __name__ == "__main__":